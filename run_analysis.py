@@ -11,7 +11,11 @@ import pandas as pd
 # Add the src directory to sys.path
 sys.path.append(os.path.join(os.path.dirname(__file__), "src"))
 
-from museum_text_analysis.bertopic_analysis import load_data, run_bertopic
+from museum_text_analysis.bertopic_analysis import (
+    combine_text_columns,
+    load_data,
+    run_bertopic,
+)
 
 # Constants
 SAMPLE_FILE = Path("sample_data/sample_responses.csv")
@@ -52,7 +56,7 @@ def analyze_sample_file(filepath: Path = SAMPLE_FILE,
     df = load_data(filepath)
 
     print("Combining text columns...")
-    df["combined_responses"] = df[TEXT_COLUMNS].astype(str).agg(" ".join, axis=1)
+    df["combined_responses"] = combine_text_columns(df, TEXT_COLUMNS)
 
     print("Running BERTopic...")
     _, model = run_bertopic(df["combined_responses"].tolist())
@@ -1,20 +1,38 @@
 """Init file for the museum_text_analysis package."""
 
-from .bertopic_analysis import load_data, run_bertopic, run_bertopic_per_column
+from .bertopic_analysis import (
+    build_embedding_store,
+    build_vectorizer,
+    combine_text_columns,
+    embed_texts,
+    load_data,
+    run_bertopic,
+    run_bertopic_per_column,
+    select_embeddings,
+)
 from .museum_topic_utils import (
     clean_text,
+    count_words,
     get_custom_stop_words,
     generate_wordcloud,
     get_top_word_frequencies,
     plot_word_frequencies,
+    word_frequency_frame,
 )
 
 __all__ = [
+    "build_embedding_store",
+    "build_vectorizer",
     "clean_text",
+    "combine_text_columns",
+    "count_words",
+    "embed_texts",
     "generate_wordcloud",
     "get_custom_stop_words",
     "get_top_word_frequencies",
     "load_data",
     "plot_word_frequencies",
     "run_bertopic",
+    "select_embeddings",
+    "word_frequency_frame",
 ]
\ No newline at end of file
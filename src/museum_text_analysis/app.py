@@ -10,23 +10,85 @@ Steps:
 """
 
 # Standard library
+import hashlib
+import io
 import pandas as pd
 
 # Third-party
+import altair as alt
+import numpy as np
 import streamlit as st
 import matplotlib.pyplot as plt
 import plotly.express as px
 from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
 
 # Local
-from museum_text_analysis.bertopic_analysis import load_data, run_bertopic, run_bertopic_per_column
+from museum_text_analysis.bertopic_analysis import (
+    _column_texts,
+    build_embedding_store,
+    combine_text_columns,
+    load_data,
+    run_bertopic,
+    run_bertopic_per_column,
+    select_embeddings,
+)
 from museum_text_analysis.museum_topic_utils import (
+    count_words,
     get_custom_stop_words,
     generate_wordcloud,
     get_top_word_frequencies,
-    plot_word_frequencies,
+    word_frequency_frame,
 )
 
+bertopic_text_columns = [
+    "What kind of emotions did the exhibit trigger in you?",
+    "Is there an item or story from the exhibit that stayed with you? If so, why?",
+    "What is your key takeaway from this exhibition?"
+]
+moved_col = "To what extent did the exhibition move you?"
+
+# Streamlit reruns this script on every widget interaction. The helpers below
+# are cached on the CSV content hash (and column list), so only a new upload
+# triggers reloading, re-embedding, or refitting. Arguments starting with an
+# underscore are not hashed by Streamlit.
+
+@st.cache_data(show_spinner=False)
+def load_responses(file_hash: str, _file_bytes: bytes, columns: tuple) -> pd.DataFrame:
+    """Load the uploaded CSV and combine the text columns into one."""
+    df = load_data(io.BytesIO(_file_bytes))
+    df["combined_responses"] = combine_text_columns(df, list(columns))
+    return df
+
+@st.cache_resource(show_spinner=False)
+def get_embedding_store(file_hash: str, columns: tuple, _df: pd.DataFrame):
+    """Embed all unique responses (combined and per column) once per file."""
+    texts = _df["combined_responses"].tolist()
+    # Read the columns exactly as run_bertopic_per_column does, so every
+    # lookup there hits a stored key
+    for col in columns:
+        texts += _column_texts(_df[col])
+    return build_embedding_store(texts)
+
+@st.cache_resource(show_spinner=False)
+def fit_overall_model(file_hash: str, columns: tuple, _df: pd.DataFrame, _store):
+    """Fit BERTopic on the combined responses and return the model and topic info."""
+    texts = _df["combined_responses"].tolist()
+    _, model = run_bertopic(texts, embeddings=select_embeddings(_store, texts))
+    return model, model.get_topic_info()
+
+@st.cache_resource(show_spinner=False)
+def fit_column_models(file_hash: str, columns: tuple, _df: pd.DataFrame, _store):
+    """Fit one BERTopic model per text column."""
+    return run_bertopic_per_column(_df[list(columns)], embedding_store=_store)
+
+def first_representative_doc(model, topic_id: int) -> str:
+    """Return the first representative response of a topic, or a placeholder."""
+    try:
+        docs = model.get_representative_docs(topic_id)
+    except Exception:
+        docs = None
+    return docs[0] if docs else "No representative examples found."
+
 # Streamlit app for BERTopic analysis
 st.title("Museum Visitor Response Topic Explorer")
 
@@ -43,25 +105,25 @@ st.sidebar.markdown("""
 uploaded_file = st.file_uploader("Upload a CSV file", type=["csv"])
 if uploaded_file:
     try:
-        df = load_data(uploaded_file)
+        file_bytes = uploaded_file.getvalue()
+        file_hash = hashlib.sha1(file_bytes).hexdigest()
+        columns = tuple(bertopic_text_columns)
+
+        # Load and combine all text responses into one column
+        df = load_responses(file_hash, file_bytes, columns)
         st.write("### Data Preview")
         st.write(df.head())
 
-        bertopic_text_columns = [
-            "What kind of emotions did the exhibit trigger in you?",
-            "Is there an item or story from the exhibit that stayed with you? If so, why?",
-            "What is your key takeaway from this exhibition?"
-        ]
-        moved_col = "To what extent did the exhibition move you?"
-
-        # Combine all text responses into one column
-        df["combined_responses"] = df[bertopic_text_columns].astype(str).agg(" ".join, axis=1)
+        # Embed every unique response once; all BERTopic runs below reuse it
+        with st.spinner("Embedding responses..."):
+            embedding_store = get_embedding_store(file_hash, columns, df)
 
         # Run overall topic modeling on all combined text
         st.subheader("Overall Topic Summary (All Responses Combined)")
         with st.spinner("Analyzing overall topics..."):
-            overall_model = run_bertopic(df["combined_responses"].tolist())[1]
-            overall_topic_info = overall_model.get_topic_info()
+            overall_model, overall_topic_info = fit_overall_model(
+                file_hash, columns, df, embedding_store
+            )
             st.dataframe(overall_topic_info)
 
             # Download button
@@ -88,7 +150,8 @@ if uploaded_file:
         # Individual column topic modeling
         st.success("Individual Topic Modeling Complete! Explore Below:")
 
-        results_per_col = run_bertopic_per_column(df[bertopic_text_columns].fillna(""))
+        with st.spinner("Analyzing topics per question..."):
+            results_per_col = fit_column_models(file_hash, columns, df, embedding_store)
 
         for col in bertopic_text_columns:
             st.header(f"Topics for: *{col}*")
@@ -108,51 +171,49 @@ if uploaded_file:
             fig.update_layout(xaxis_tickangle=-45, title_x=0.3)
             st.plotly_chart(fig)
 
-            st.subheader("Top Keywords per Topic")
-            for _, row in topics_df.iterrows():
-                topic_id = row["Topic"]
-                keywords = model.get_topic(topic_id)
-                keyword_str = ", ".join([word for word, _ in keywords[:10]])
-                st.markdown(f"**Topic {topic_id}**: {keyword_str}")
-
-            st.subheader("Representative Responses")
-            for _, row in topics_df.iterrows():
-                topic_id = row["Topic"]
-                st.markdown(f"**Topic {topic_id}**:")
-                try:
-                    docs = model.get_representative_docs(topic_id)
-                    if docs:
-                        st.write(f"\u2022 {docs[0]}")
-                    else:
-                        st.write("No representative examples found.")
-                except Exception:
-                    st.write("No representative examples found.")
+            st.subheader("Top Keywords and Representative Responses")
+            topics_df["Keywords"] = topics_df["Topic"].map(
+                lambda topic_id: ", ".join(word for word, _ in model.get_topic(topic_id)[:10])
+            )
+            topics_df["Representative Response"] = topics_df["Topic"].map(
+                lambda topic_id: first_representative_doc(model, topic_id)
+            )
+            st.dataframe(
+                topics_df[["Topic", "Keywords", "Representative Response"]],
+                width="stretch",
+                hide_index=True,
+            )
 
         # Phrase frequency bar chart for moved_col
         st.write(f"### Phrase Frequencies in '{moved_col}'")
-        cleaned = df[moved_col].dropna().str.strip().str.lower()
-        freq = cleaned.value_counts()
         expected_phrases = ["deeply moved", "very moved", "somewhat moved", "not at all"]
-        freq_full = {phrase: freq.get(phrase, 0) for phrase in expected_phrases}
+        cleaned = df[moved_col].fillna("").str.strip().str.lower()
+        codes = pd.Categorical(cleaned, categories=expected_phrases).codes
+        freq_full = pd.Series(
+            np.bincount(codes[codes >= 0], minlength=len(expected_phrases)),
+            index=expected_phrases,
+        )
 
         for phrase, count in freq_full.items():
             st.write(f"{phrase.title()}: {count} occurrence(s)")
 
-        st.bar_chart(pd.Series(freq_full))
+        st.bar_chart(freq_full)
 
         # Word cloud of combined responses
         st.write("### Word Cloud of Responses")
-        combined_text_str = " ".join(df["combined_responses"]).lower()
         stop_words = get_custom_stop_words()
-        fig_wc = generate_wordcloud(combined_text_str, stop_words)
+        word_counts = count_words(df["combined_responses"], stop_words)
+        fig_wc = generate_wordcloud(word_counts)
         st.pyplot(fig_wc)
 
         # Optional frequency plot
         if st.checkbox("Show Top Word Frequencies"):
-            stop_words = get_custom_stop_words()
-            words, counts = get_top_word_frequencies(combined_text_str, stop_words=stop_words)
-            fig = plot_word_frequencies(words, counts)
-            st.pyplot(fig)
+            words, counts = get_top_word_frequencies(word_counts)
+            freq_chart = alt.Chart(word_frequency_frame(words, counts)).mark_bar().encode(
+                x=alt.X("count", title="Frequency"),
+                y=alt.Y("word", title="Words", sort="-x"),
+            ).properties(title=f"Top {len(words)} Words in Combined Responses")
+            st.altair_chart(freq_chart, width="stretch")
 
     except Exception as e:
         st.error(f"Error: {e}")
\ No newline at end of file
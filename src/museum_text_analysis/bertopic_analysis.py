@@ -9,27 +9,351 @@ Includes:
 """
 
 # Standard library
-import pandas as pd
-from typing import Dict
+import hashlib
+import io
+import multiprocessing as mp
+import os
+import re
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+from typing import Dict, Optional, Tuple
 
 # Third-party
+import diskcache
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pacsv
+import torch
 from bertopic import BERTopic
-from umap import UMAP
-from hdbscan import HDBSCAN
+from bertopic.backend import BaseEmbedder
+from sklearn.base import clone
 from sklearn.feature_extraction.text import CountVectorizer
 from sentence_transformers import SentenceTransformer
 
+# Prefer the GPU implementations from RAPIDS cuML when they are installed and
+# a CUDA device is present; otherwise use the CPU libraries
+try:
+    if not torch.cuda.is_available():
+        raise ImportError("cuML needs a CUDA device")
+    from cuml.cluster import HDBSCAN
+    from cuml.manifold import UMAP
+    _GPU_CLUSTERING = True
+except ImportError:
+    from hdbscan import HDBSCAN
+    from umap import UMAP
+    _GPU_CLUSTERING = False
+
 # Local
 from museum_text_analysis.museum_topic_utils import get_custom_stop_words
 
+# Sentence embedding model and the on-disk cache of its outputs. The cache is
+# namespaced by model name and precision so vectors from different embedders
+# never mix.
+EMBEDDING_MODEL_NAME = "all-MiniLM-L6-v2"
+EMBEDDING_CACHE_DIR = Path(".embed_cache")
+# Whole-corpus .npy files kept beside the per-response cache. Their vectors are
+# also in the size-limited diskcache, so older files are simply dropped.
+_MAX_CORPUS_FILES = 8
+
+@lru_cache(maxsize=1)
+def _get_embedding_model() -> SentenceTransformer:
+    """Load the MiniLM embedding model once per process, on the GPU when available.
+
+    The encoder runs in float16 on CUDA and with int8 dynamically quantized
+    linear layers on CPU, roughly doubling encode throughput in both cases. A
+    CPU build without a quantized engine keeps the float32 model.
+    """
+    device = "cuda" if torch.cuda.is_available() else "cpu"
+    embedding_model = SentenceTransformer(EMBEDDING_MODEL_NAME, device=device)
+    if device == "cuda":
+        return embedding_model.half()
+
+    transformer = embedding_model[0]
+    try:
+        transformer.auto_model = torch.ao.quantization.quantize_dynamic(
+            transformer.auto_model, {torch.nn.Linear}, dtype=torch.qint8
+        )
+    except (AttributeError, RuntimeError):
+        # No quantized engine on this platform, or no eager quantization API
+        pass
+    return embedding_model
+
+def _cache_namespace(embedding_model: SentenceTransformer) -> str:
+    """Return the cache directory name for vectors from ``embedding_model``."""
+    if embedding_model.device.type == "cuda":
+        precision = "fp16"
+    elif any(
+        isinstance(module, torch.ao.nn.quantized.dynamic.Linear)
+        for module in embedding_model.modules()
+    ):
+        precision = "int8"
+    else:
+        precision = "fp32"
+    return f"{EMBEDDING_MODEL_NAME}-{precision}"
+
+# Seed topics to guide the model, shared by every BERTopic run. BERTopic boosts
+# vocabulary terms that match a seed word exactly, and the vocabulary is
+# lowercased, so the seed words are too; MiniLM is uncased, so this does not
+# change the seed-topic embeddings.
+_SEED_TOPICS = (
+    ("children", "sad", "anger", "cry"),
+    ("fear", "hope", "inspiration"),
+    ("fear", "shock", "sadness", "u.s"),
+    ("never again", "warning", "repeat", "history"),
+    ("usa", "sobibor", "trump", "don't forget"),
+    ("resist", "kind", "aware", "sadness"),
+)
+
+# Unfitted UMAP and HDBSCAN configurations. Each run fits its own clone, so
+# models never share fitted state.
+_UMAP_PARAMS = dict(n_neighbors=15, n_components=5, min_dist=0.2, metric="cosine")
+_HDBSCAN_PARAMS = dict(
+    min_cluster_size=15, metric="euclidean", cluster_selection_method="eom"
+)
+if not _GPU_CLUSTERING:
+    # CPU-only options: lower peak memory in UMAP's nearest-neighbor search and
+    # core distances computed on all cores
+    _UMAP_PARAMS["low_memory"] = True
+    _HDBSCAN_PARAMS["core_dist_n_jobs"] = -1
+_UMAP_TEMPLATE = UMAP(**_UMAP_PARAMS)
+_HDBSCAN_TEMPLATE = HDBSCAN(**_HDBSCAN_PARAMS)
+
+# Tokens for c-TF-IDF: lowercase words of at least three letters, keeping at
+# most the most frequent _MAX_FEATURES of them
+_TOKEN_PATTERN = r"(?u)\b[a-z]{3,}\b"
+_MAX_FEATURES = 50_000
+
+# Single-token seed words, kept in every vocabulary so that pruning never
+# removes a term the seed topics are meant to boost
+_SEED_WORDS = frozenset(
+    word for topic in _SEED_TOPICS for word in topic
+    if re.fullmatch(_TOKEN_PATTERN, word)
+)
+
+@lru_cache(maxsize=1)
+def _stop_words_list() -> list[str]:
+    """Return the custom stop words as the list CountVectorizer expects, built once."""
+    return sorted(get_custom_stop_words())
+
+def _text_key(text: str) -> str:
+    """Return the cache key for a single response."""
+    return hashlib.sha1(text.strip().lower().encode("utf-8")).hexdigest()
+
+def embed_texts(texts: list[str]) -> np.ndarray:
+    """Embed texts with MiniLM, reusing vectors cached on disk.
+
+    Each response is keyed by a hash of its normalized text, so identical
+    responses (within a run or across runs) are only encoded once. Only the
+    cache misses go through the transformer. Vectors are stored as float16,
+    which halves the memory and disk footprint of the cache and of embedding
+    stores built on top of it.
+
+    Args:
+        texts (list[str]): Text responses to embed.
+
+    Returns:
+        np.ndarray: A ``(len(texts), dim)`` float16 array of normalized embeddings.
+
+    Examples:
+        >>> embeddings = embed_texts(["I felt sadness", "I felt sadness"])
+        >>> embeddings.shape
+        (2, 384)
+    """
+    embedding_model = _get_embedding_model()
+    embeddings = np.empty(
+        (len(texts), embedding_model.get_sentence_embedding_dimension()),
+        dtype=np.float16,
+    )
+
+    cache_dir = EMBEDDING_CACHE_DIR / _cache_namespace(embedding_model)
+    with diskcache.Cache(str(cache_dir)) as cache:
+        # Group cache misses by key so duplicates are encoded once
+        missing: Dict[str, list[int]] = {}
+        for i, text in enumerate(texts):
+            key = _text_key(text)
+            cached = cache.get(key)
+            if cached is None:
+                missing.setdefault(key, []).append(i)
+            else:
+                embeddings[i] = cached
+
+        if missing:
+            # Larger batches keep the GPU busy; on CPU they only add padding
+            batch_size = 128 if embedding_model.device.type == "cuda" else 64
+            encoded = embedding_model.encode(
+                [texts[indices[0]] for indices in missing.values()],
+                batch_size=batch_size,
+                convert_to_numpy=True,
+                normalize_embeddings=True,
+                show_progress_bar=False,
+            )
+            for (key, indices), vector in zip(missing.items(), encoded.astype(np.float16)):
+                embeddings[indices] = vector
+                cache.set(key, vector)
+
+    return embeddings
+
+def _embed_cached(texts: list[str]) -> np.ndarray:
+    """Embed a whole corpus, reusing a memory-mapped ``.npy`` from an earlier run.
+
+    The file is keyed by a SHA-256 of the corpus, so an unchanged upload is a
+    single ``np.load`` instead of one cache lookup per response. Any other
+    corpus falls through to ``embed_texts`` and its per-response cache. Only
+    the ``_MAX_CORPUS_FILES`` most recently used corpora are kept.
+    """
+    digest = hashlib.sha256()
+    for text in texts:
+        encoded = text.encode("utf-8")
+        digest.update(f"{len(encoded)}:".encode("ascii") + encoded)
+
+    corpus_dir = EMBEDDING_CACHE_DIR / f"{_cache_namespace(_get_embedding_model())}-corpora"
+    path = corpus_dir / f"{digest.hexdigest()}.npy"
+    try:
+        # Refresh the modification time so eviction treats the file as recent
+        os.utime(path)
+        return np.load(path, mmap_mode="r")
+    except FileNotFoundError:
+        pass
+
+    embeddings = embed_texts(texts)
+    corpus_dir.mkdir(parents=True, exist_ok=True)
+    # Write to a unique temporary file first so neither readers nor concurrent
+    # writers of the same corpus ever see a partial array
+    fd, tmp_name = tempfile.mkstemp(dir=corpus_dir, suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as tmp_file:
+            np.save(tmp_file, embeddings)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+    _evict_old_corpora(corpus_dir)
+    return embeddings
+
+def _evict_old_corpora(corpus_dir: Path) -> None:
+    """Delete all but the ``_MAX_CORPUS_FILES`` most recently used corpus files.
+
+    Eviction is best effort: files already removed by another process, or
+    still memory-mapped on a platform that forbids deleting them, are skipped.
+    """
+    mtimes = {}
+    for path in corpus_dir.glob("*.npy"):
+        try:
+            mtimes[path] = path.stat().st_mtime
+        except OSError:
+            continue
+    for path in sorted(mtimes, key=mtimes.get)[:-_MAX_CORPUS_FILES]:
+        try:
+            path.unlink()
+        except OSError:
+            continue
+
+def build_embedding_store(texts: list[str]) -> Tuple[Dict[str, int], np.ndarray]:
+    """Embed every unique document once for reuse across BERTopic runs.
+
+    The overall and per-column analyses see many of the same responses, so the
+    embedding pass is done once over the unique documents and each run takes
+    the rows it needs with ``select_embeddings``.
+
+    Args:
+        texts (list[str]): All documents that any later BERTopic run will see.
+
+    Returns:
+        Tuple[Dict[str, int], np.ndarray]: A mapping from document to row index
+        and the embedding matrix holding one row per unique document.
+
+    Examples:
+        >>> store = build_embedding_store(["hope", "fear", "hope"])
+        >>> store[1].shape
+        (2, 384)
+    """
+    unique_texts = list(dict.fromkeys(texts))
+    index = {text: i for i, text in enumerate(unique_texts)}
+    return index, _embed_cached(unique_texts)
+
+def select_embeddings(
+    store: Tuple[Dict[str, int], np.ndarray], texts: list[str]
+) -> np.ndarray:
+    """Return the rows of an embedding store matching ``texts``, in order.
+
+    Args:
+        store: The ``(index, embeddings)`` pair from ``build_embedding_store``.
+        texts (list[str]): Documents to look up. All must be in the store.
+
+    Returns:
+        np.ndarray: A ``(len(texts), dim)`` embedding matrix.
+
+    Examples:
+        >>> store = build_embedding_store(["hope", "fear"])
+        >>> select_embeddings(store, ["fear"]).shape
+        (1, 384)
+    """
+    index, embeddings = store
+    return embeddings[[index[text] for text in texts]]
+
+def _is_arrow_backed(dtype) -> bool:
+    """Return whether a pandas dtype stores its strings in Arrow buffers."""
+    if isinstance(dtype, pd.ArrowDtype):
+        return True
+    return isinstance(dtype, pd.StringDtype) and dtype.storage.startswith("pyarrow")
+
+def _column_texts(series: pd.Series) -> list[str]:
+    """Return a text column as a list of strings, with missing values as ``""``.
+
+    Arrow-backed columns are read straight from their Arrow buffers, skipping
+    the pandas ``astype(str)`` round trip.
+    """
+    if _is_arrow_backed(series.dtype):
+        return pc.fill_null(pa.array(series.array), "").to_pylist()
+    return series.fillna("").astype(str).tolist()
+
+def combine_text_columns(df: pd.DataFrame, columns: list[str]) -> pd.Series:
+    """Join several text columns row-wise into a single space-separated column.
+
+    Missing values are treated as empty strings. Columns that are not yet
+    Arrow-backed are converted to ``string[pyarrow]`` first, and the join runs
+    in Arrow's ``binary_join_element_wise`` kernel rather than a per-row
+    Python ``" ".join``.
+
+    Args:
+        df (pd.DataFrame): DataFrame holding the text columns.
+        columns (list[str]): Names of the columns to join, in order.
+
+    Returns:
+        pd.Series: The combined text, one entry per row of ``df``.
+
+    Examples:
+        >>> df = pd.DataFrame({"a": ["hope", None], "b": ["fear", "anger"]})
+        >>> combine_text_columns(df, ["a", "b"]).tolist()
+        ['hope fear', ' anger']
+    """
+    arrays = []
+    for col in columns:
+        series = df[col]
+        if not _is_arrow_backed(series.dtype):
+            series = series.astype("string[pyarrow]")
+        arrays.append(pa.array(series.array).cast(pa.large_string()))
+
+    separator = pa.scalar(" ", type=pa.large_string())
+    joined = pc.binary_join_element_wise(*arrays, separator, null_handling="replace")
+    return pd.Series(pd.arrays.ArrowStringArray(joined), index=df.index)
+
 def load_data(uploaded_file) -> pd.DataFrame:
     """Load and prepare the data you want to analyze.
 
     This function reads a CSV file and combines three open-ended text response 
-    columns into a single column for further text analysis.
+    columns into a single column for further text analysis. Only the expected
+    columns are parsed, with pyarrow's multithreaded CSV reader, and they are
+    kept as Arrow-backed strings.
 
     Args:
-        uploaded_file: A file-like object containing the CSV data to be processed.
+        uploaded_file: A path or file-like object containing the CSV data to be
+            processed.
 
     Returns:
         df (pd.DataFrame): A DataFrame containing the combined text responses.
@@ -41,7 +365,7 @@ def load_data(uploaded_file) -> pd.DataFrame:
         >>> from io import StringIO
         >>> csv_data = StringIO(
         ...     "What kind of emotions did the exhibit trigger in you?,"
-        ...     "Is there an item or story from the exhibit that stayed with you? If so, why?,"
+        ...     '"Is there an item or story from the exhibit that stayed with you? If so, why?",'
         ...     "What is your key takeaway from this exhibition?,"
         ...     "To what extent did the exhibition move you?\\n"
         ...     "Sadness,The suitcase of a child,Reminded me of the importance of remembering,Very much"
@@ -50,9 +374,6 @@ def load_data(uploaded_file) -> pd.DataFrame:
         >>> print(df['combined_text'].iloc[0])
         Sadness The suitcase of a child Reminded me of the importance of remembering Very much
     """
-    # Read CSV file from the uploaded file object
-    df = pd.read_csv(uploaded_file, sep=",")
-
     text_columns = [
         "What kind of emotions did the exhibit trigger in you?",
         "Is there an item or story from the exhibit that stayed with you? If so, why?",
@@ -60,20 +381,96 @@ def load_data(uploaded_file) -> pd.DataFrame:
         "To what extent did the exhibition move you?"
     ]
 
-    for col in text_columns:
-        if col not in df.columns:
-            raise ValueError(f"Column '{col}' not found in the dataset.")
+    # pyarrow's reader takes paths or binary streams only
+    source = uploaded_file
+    if isinstance(source, io.TextIOBase):
+        source = io.BytesIO(source.read().encode("utf-8"))
+    elif isinstance(source, os.PathLike):
+        source = os.fspath(source)
+
+    # Read only the needed columns, as strings, with pyarrow's multithreaded parser
+    try:
+        table = pacsv.read_csv(
+            source,
+            read_options=pacsv.ReadOptions(use_threads=True),
+            # Open-ended answers often span several lines inside quotes
+            parse_options=pacsv.ParseOptions(delimiter=",", newlines_in_values=True),
+            convert_options=pacsv.ConvertOptions(
+                include_columns=text_columns,
+                column_types={col: pa.string() for col in text_columns},
+                strings_can_be_null=True,
+            ),
+        )
+    except KeyError as exc:
+        raise ValueError(f"Expected column not found in the dataset: {exc}") from exc
+
+    # Keep the Arrow buffers, exposed as pandas' pyarrow-backed string dtype
+    df = table.to_pandas(types_mapper={pa.string(): pd.StringDtype("pyarrow")}.get)
 
     # Combine the three text columns into a single column
-    df["combined_text"] = df[text_columns].fillna("").agg(" ".join, axis=1)
+    df["combined_text"] = combine_text_columns(df, text_columns)
 
     return df
 
-def run_bertopic(texts: list[str]) -> tuple[list[int], BERTopic]:
+def build_vectorizer(texts: list[str]) -> CountVectorizer:
+    """Build a CountVectorizer with a vocabulary frozen from ``texts``.
+
+    The vocabulary is learned once over all documents, so BERTopic runs that
+    share the returned vectorizer skip the vocabulary-building pass and only
+    count tokens. Only lowercase words of three or more letters are kept, and
+    terms found in a single response or in nearly all of them are pruned. The
+    pruning happens here because BERTopic fits its vectorizer on one joined
+    document per topic, where document-frequency limits mean something else.
+    Seed-topic words are always kept.
+
+    Args:
+        texts (list[str]): Documents covering every later BERTopic run.
+
+    Returns:
+        CountVectorizer: An unfitted vectorizer with a fixed ``vocabulary``.
+
+    Examples:
+        >>> vectorizer = build_vectorizer(["hope and fear", "sadness"])
+        >>> {"fear", "hope", "sadness"} <= set(vectorizer.vocabulary)
+        True
+    """
+    stop_words = _stop_words_list()
+    try:
+        vocabulary = CountVectorizer(
+            stop_words=stop_words,
+            token_pattern=_TOKEN_PATTERN,
+            min_df=2,
+            max_df=0.95,
+            max_features=_MAX_FEATURES,
+        ).fit(texts).vocabulary_
+    except ValueError:
+        # Very small corpora can prune every term; keep them unpruned instead
+        vocabulary = CountVectorizer(
+            stop_words=stop_words, token_pattern=_TOKEN_PATTERN, max_features=_MAX_FEATURES
+        ).fit(texts).vocabulary_
+
+    # Append any pruned seed words after the learned terms, keeping indices contiguous
+    vocabulary = dict(vocabulary)
+    for word in sorted(_SEED_WORDS - vocabulary.keys()):
+        vocabulary[word] = len(vocabulary)
+    # Survey-sized counts fit comfortably in int32, half the size of the default int64
+    return CountVectorizer(
+        stop_words=stop_words,
+        token_pattern=_TOKEN_PATTERN,
+        vocabulary=vocabulary,
+        dtype=np.int32,
+    )
+
+def run_bertopic(
+    texts: list[str],
+    embeddings: Optional[np.ndarray] = None,
+    vectorizer_model: Optional[CountVectorizer] = None,
+    embedding_model: Optional[SentenceTransformer] = None,
+) -> tuple[list[int], BERTopic]:
     """Fit BERTopic to a list of texts and return topics + model.
     
     This function performs topic modeling using BERTopic with a custom pipeline:
-    - A CountVectorizer using custom stop words.
+    - A CountVectorizer using custom stop words and a pruned vocabulary.
     - A sentence embedding model (MiniLM).
     - UMAP for dimensionality reduction.
     - HDBSCAN for clustering.
@@ -81,6 +478,15 @@ def run_bertopic(texts: list[str]) -> tuple[list[int], BERTopic]:
 
     Args:
         texts (list[str]): A list of open-ended text responses to analyze.
+        embeddings (np.ndarray, optional): Precomputed embeddings for ``texts``.
+            When omitted, they are computed with ``embed_texts``, or loaded
+            from disk if the same corpus was embedded before.
+        vectorizer_model (CountVectorizer, optional): Vectorizer for the
+            c-TF-IDF step, e.g. a shared one from ``build_vectorizer``. A copy
+            is used, so the same instance can be passed to several runs.
+        embedding_model (SentenceTransformer, optional): Embedding model used by
+            BERTopic, e.g. for the seed topics. Defaults to the process-wide
+            MiniLM instance.
 
     Returns:
         tuple[list[int], BERTopic]: A tuple containing the list of topics 
@@ -102,65 +508,119 @@ def run_bertopic(texts: list[str]) -> tuple[list[int], BERTopic]:
     if not texts or not isinstance(texts, list):
         raise ValueError("Input texts must be a non-empty list.")
 
-    # Custom vectorizer with stop words
-    vectorizer_model = CountVectorizer(stop_words=list(get_custom_stop_words()))
+    # Custom vectorizer with stop words and a pruned vocabulary
+    if vectorizer_model is None:
+        vectorizer_model = build_vectorizer(texts)
+    else:
+        vectorizer_model = clone(vectorizer_model)
 
-    # Custom embedding model for better quality
-    embedding_model = SentenceTransformer("all-MiniLM-L6-v2")
+    # Custom embedding model for better quality, loaded once per process
+    if embedding_model is None:
+        embedding_model = _get_embedding_model()
 
-    # Custom dimensionality reduction
-    umap_model = UMAP(n_neighbors=10, n_components=5, min_dist=0.3, metric="cosine")
-
-    # Use UMAP for more focused clusters
-    umap_model = UMAP(
-        n_neighbors=15,         
-        n_components=5,
-        min_dist=0.2,           
-        metric="cosine"
-    )
-
-    # Use HDBSCAN for stricter cluster formation
-    hdbscan_model = HDBSCAN(
-        min_cluster_size=15,   
-        metric="euclidean",
-        cluster_selection_method="eom"
-    )
-
-    # Seed topics to guide the model
-    seed_topic_list = [
-        ["children", "sad", "anger", "cry"],
-        ["fear", "hope", "inspiration"],
-        ["fear", "shock", "sadness", "U.S"],
-        ["never again", "warning", "repeat", "history"],
-        ["USA", "Sobibor", "Trump", "don't forget"],
-        ["resist", "kind", "aware", "sadness"]
-    ]
+    # Use UMAP for more focused clusters and HDBSCAN for stricter cluster formation
+    umap_model = clone(_UMAP_TEMPLATE)
+    hdbscan_model = clone(_HDBSCAN_TEMPLATE)
 
     model = BERTopic(
         embedding_model=embedding_model,
         umap_model=umap_model,
         hdbscan_model=hdbscan_model,
         vectorizer_model=vectorizer_model,
-        seed_topic_list=seed_topic_list,
+        seed_topic_list=_SEED_TOPICS,
         min_topic_size=15,
+        calculate_probabilities=False,
+        # Reduce to fewer topics inside fit_transform, reusing its embeddings
+        nr_topics=5,
         verbose=True
     )
 
-    topics, _ = model.fit_transform(texts)
-
-    # Force reduction to fewer topics if needed
-    model.reduce_topics(texts, nr_topics=5)
+    # Precompute (cached) embeddings so BERTopic skips its own encoding pass.
+    # Repeated responses are encoded once there but still clustered once per
+    # respondent, since HDBSCAN's minimum cluster size counts those repeats.
+    if embeddings is None:
+        embeddings = _embed_cached(texts)
+    # UMAP computes in float32 on every backend, so upcast only this slice
+    topics, _ = model.fit_transform(texts, embeddings=embeddings.astype(np.float32))
 
     return topics, model
 
-def run_bertopic_per_column(df: pd.DataFrame) -> Dict[str, Dict[str, object]]:
+class _SeedTopicEmbedder(BaseEmbedder):
+    """Serve precomputed seed-topic embeddings to BERTopic in place of MiniLM.
+
+    When document embeddings are passed to ``fit_transform``, BERTopic mostly
+    calls its embedding model to embed the joined seed topics, which this
+    lookup table answers without loading the encoder. Anything else, such as
+    topic keywords when topics are reduced or new documents passed to
+    ``transform``, goes through ``embed_texts`` and so loads MiniLM on first use.
+    """
+
+    def __init__(self, vectors: Dict[str, np.ndarray]):
+        super().__init__()
+        self.vectors = vectors
+
+    def embed(self, documents: list[str], verbose: bool = False) -> np.ndarray:
+        vectors = [self.vectors.get(document.lower()) for document in documents]
+        missing = [i for i, vector in enumerate(vectors) if vector is None]
+        if missing:
+            encoded = embed_texts([documents[i] for i in missing]).astype(np.float32)
+            for i, vector in zip(missing, encoded):
+                vectors[i] = vector
+        return np.vstack(vectors)
+
+def _seed_topic_embedder() -> _SeedTopicEmbedder:
+    """Embed the joined seed topics once, the way BERTopic's guided mode asks for them."""
+    seed_texts = [" ".join(topic) for topic in _SEED_TOPICS]
+    vectors = embed_texts(seed_texts).astype(np.float32)
+    return _SeedTopicEmbedder(
+        {text.lower(): vector for text, vector in zip(seed_texts, vectors)}
+    )
+
+def _fit_one(
+    col: str,
+    texts: list[str],
+    embeddings: Optional[np.ndarray],
+    vectorizer_model: CountVectorizer,
+    embedding_model: _SeedTopicEmbedder,
+) -> Tuple[str, list[int], BERTopic]:
+    """Fit BERTopic on one column; module-level so worker processes can pickle it.
+
+    The fitted model keeps the seed-topic embedder, which holds no encoder, so
+    a worker never pickles a copy of MiniLM back to the parent.
+    """
+    topics, model = run_bertopic(
+        texts,
+        embeddings=embeddings,
+        vectorizer_model=vectorizer_model,
+        embedding_model=embedding_model,
+    )
+    return col, topics, model
+
+def run_bertopic_per_column(
+    df: pd.DataFrame,
+    embedding_store: Optional[Tuple[Dict[str, int], np.ndarray]] = None,
+    max_workers: int = 1,
+) -> Dict[str, Dict[str, object]]:
     """Run BERTopic separately for each column in a DataFrame of text responses.
 
-    This function iterates over each column in the DataFrame, applies the
-    BERTopic model to the open-text responses, and returns a dictionary of results.
+    This function applies the BERTopic model to the open-text responses of each
+    column and returns a dictionary of results. The columns are fitted one
+    after another in this process by default. They are independent, so large
+    corpora can opt into a process pool with ``max_workers``. Each spawned
+    worker re-imports torch, BERTopic and UMAP, which takes longer than
+    fitting survey-sized columns, so the pool only pays off once a single
+    column's fit takes tens of seconds. All columns share one vocabulary,
+    built once over every response.
 
     Args:
         df (pd.DataFrame): DataFrame where each column contains open-text responses.
+        embedding_store: Optional ``(index, embeddings)`` pair from
+            ``build_embedding_store`` covering every response in ``df``. When
+            omitted, one store is built here over all columns, so responses
+            shared between columns are embedded once.
+        max_workers (int, optional): Number of worker processes. Defaults to
+            ``1``, which fits the columns sequentially in this process. Ignored
+            when CUDA is available.
 
     Returns:
         Dict[str, Dict[str, object]]: A dictionary where keys are column names and 
@@ -181,9 +641,38 @@ def run_bertopic_per_column(df: pd.DataFrame) -> Dict[str, Dict[str, object]]:
         >>> print(results["emotions"]["topics"])
         [0, 1]
     """
-    results = {}
-    for col in df.columns:
-        texts = df[col].fillna("").astype(str).tolist()
-        topics, model = run_bertopic(texts)
-        results[col] = {"model": model, "topics": topics}
-    return results
+    texts_per_col = {col: _column_texts(df[col]) for col in df.columns}
+    all_texts = [text for texts in texts_per_col.values() for text in texts]
+
+    # Tokenize the union of all columns once and share the frozen vocabulary
+    vectorizer_model = build_vectorizer(all_texts)
+
+    # Embed all columns in one batched pass before any model is fitted
+    if embedding_store is None:
+        embedding_store = build_embedding_store(all_texts)
+
+    # Every document is already embedded, so the fits only need the seed topics
+    # embedded; ship those vectors with each job instead of an encoder
+    seed_embedder = _seed_topic_embedder()
+    jobs = [
+        (
+            col,
+            texts,
+            select_embeddings(embedding_store, texts),
+            vectorizer_model,
+            seed_embedder,
+        )
+        for col, texts in texts_per_col.items()
+    ]
+
+    # A single GPU gains nothing from several processes contending for it
+    if max_workers <= 1 or len(jobs) <= 1 or torch.cuda.is_available():
+        fitted = [_fit_one(*job) for job in jobs]
+    else:
+        # Spawn rather than fork so workers never inherit torch's thread pools
+        with ProcessPoolExecutor(
+            max_workers=max_workers, mp_context=mp.get_context("spawn")
+        ) as executor:
+            fitted = list(executor.map(_fit_one, *zip(*jobs)))
+
+    return {col: {"model": model, "topics": topics} for col, topics, model in fitted}
@@ -12,16 +12,41 @@ This module includes:
 
 # Standard library
 import re
+import string
 from collections import Counter
-from typing import List, Tuple, Dict
+from functools import lru_cache
+from itertools import chain
+from typing import Dict, Iterable, List, Mapping, Tuple, Union
 
 # Third-party
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
-import seaborn as sns
 from sklearn.feature_extraction.text import ENGLISH_STOP_WORDS
 from wordcloud import WordCloud
 
+# Word cloud settings: horizontal-only placement skips the rotated retries in
+# the layout loop, and a fixed seed makes the layout deterministic across reruns
+_WORDCLOUD_PARAMS = dict(
+    width=800,
+    height=400,
+    background_color="#0e1117",
+    colormap="cividis",
+    max_words=200,
+    relative_scaling=0.5,
+    prefer_horizontal=1.0,
+    random_state=42,
+)
+
+# Punctuation (including "-", "+" and "&") and digit runs, replaced in one pass
+_CLEAN_RE = re.compile(r"[^\w\s]|\d+")
+
+# The same replacement as a translation table for ASCII text. "_" is a word
+# character for the regex, so it is kept here too.
+_CLEAN_TABLE = str.maketrans(
+    {char: " " for char in string.punctuation + string.digits if char != "_"}
+)
+
 def clean_text(text: str) -> str:
     """Cleans text by removing punctuation, digits, and extra whitespace.
 
@@ -32,22 +57,34 @@ def clean_text(text: str) -> str:
         text: Raw input string.
 
     Returns:
-        A cleaned and lowercased string with punctuation and digits removed.
+        A cleaned and lowercased string with punctuation and digits removed
+        and runs of whitespace collapsed to single spaces.
 
     Examples:
         >>> clean_text("Hello, World! 1234")
         'hello world'
         >>> clean_text("Museum & Artifacts - A Journey")
-        'museum artifacts journey'
+        'museum artifacts a journey'
         >>> clean_text("Deeply moved by the experience!")
         'deeply moved by the experience'
     """
-    text = re.sub(r"[-+&]", " ", text)
-    text = re.sub(r"[^\w\s]", " ", text)
-    text = re.sub(r"\d+", "", text)
-    return text.lower().strip()
+    # ASCII text goes through a C-level table lookup; anything else needs the
+    # regex to catch Unicode punctuation and digits
+    if text.isascii():
+        text = text.translate(_CLEAN_TABLE)
+    else:
+        text = _CLEAN_RE.sub(" ", text)
+    return " ".join(text.lower().split())
+
+@lru_cache(maxsize=1)
+def _base_stop_words() -> frozenset:
+    """Build the English plus project-specific stop words once."""
+    project_specific = {
+        "somewhat", "very", "deeply", "moved", "not at all", "s", "felt", "experienced"
+    }
+    return frozenset(ENGLISH_STOP_WORDS).union(project_specific)
 
-def get_custom_stop_words(additional: set[str] = None) -> set[str]:
+def get_custom_stop_words(additional: set[str] = None) -> frozenset:
     """Returns a consistent set of stop words for text anlaysis.
 
     Combines standard English stop words with project-specific terms that should
@@ -58,28 +95,67 @@ def get_custom_stop_words(additional: set[str] = None) -> set[str]:
         additional: Optional set of additional stop words to include.
 
     Returns:
-        set[str]: A unified set of stop words including base English stop words
-        and project-specific stop words.
+        frozenset: A unified, immutable set of stop words including base English
+        stop words and project-specific stop words. Without ``additional`` the
+        same cached instance is returned on every call.
     
     Examples:
         >>> custom_stop_words = get_custom_stop_words({"exhibition", "museum"})
         >>> print(custom_stop_words)
         {'the', 'and', 'is', 'exhibition', 'museum', ...}
     """
-    base_stop_words = set(ENGLISH_STOP_WORDS)
-    project_specific = {
-        "somewhat", "very", "deeply", "moved", "not at all", "s", "felt", "experienced"
-    }
-    combined = base_stop_words.union(project_specific)
+    combined = _base_stop_words()
     if additional:
         combined = combined.union(additional)
     return combined
 
-def generate_wordcloud(text: str, stopwords: set = None) -> plt.Figure:
+@lru_cache(maxsize=8)
+def _stop_words_pattern(stop_words: frozenset) -> re.Pattern:
+    """Compile one regex matching any stop word as a whole whitespace-separated token.
+
+    Longer words come first so that multi-word entries win over their parts.
+    """
+    alternation = "|".join(
+        re.escape(word) for word in sorted(stop_words, key=len, reverse=True)
+    )
+    return re.compile(r"(?<!\S)(?:" + alternation + r")(?!\S)")
+
+# Compile the default stop-word pattern at import time
+_stop_words_pattern(frozenset(get_custom_stop_words()))
+
+def count_words(texts: Iterable[str], stop_words: set[str] = None) -> Counter:
+    """Count cleaned words across many texts without joining them first.
+
+    Tokens are streamed from each text in turn, so no single corpus-sized
+    string is built. The result can be passed to ``generate_wordcloud`` and
+    ``get_top_word_frequencies`` in place of raw text.
+
+    Args:
+        texts: Iterable of raw text responses.
+        stop_words: Optional set of stop words to exclude.
+
+    Returns:
+        Counter: Word counts over all texts.
+
+    Examples:
+        >>> count_words(["Hope, and fear!", "hope"], stop_words={"and"})
+        Counter({'hope': 2, 'fear': 1})
+    """
+    # Counter consumes the token stream in C; stop words are then removed once
+    # per distinct word instead of being tested once per token in Python
+    counts = Counter(chain.from_iterable(clean_text(text).split() for text in texts))
+    for word in counts.keys() & frozenset(stop_words or ()):
+        del counts[word]
+    return counts
+
+def generate_wordcloud(
+    text: Union[str, Mapping[str, int]], stopwords: set = None
+) -> plt.Figure:
     """Generate a matplotlib word cloud figure from input text.
 
     Args:
-        text: Concatenated input text.
+        text: Concatenated input text, or precomputed word counts such as the
+            output of ``count_words``.
         stopwords: Optional set of stopwords to remove from word cloud.
 
     Returns:
@@ -90,18 +166,20 @@ def generate_wordcloud(text: str, stopwords: set = None) -> plt.Figure:
         >>> fig = generate_wordcloud(text)
         >>> plt.show(fig)
     """
-    if stopwords is None:
-        stopwords = set()
-
-    words = " ".join(
-        [word for word in text.lower().split() if word not in stopwords]
-    )
-    wordcloud = WordCloud(
-        width=800, 
-        height=400, 
-        background_color="#0e1117", 
-        colormap="cividis",
-    ).generate(words)
+    wordcloud = WordCloud(**_WORDCLOUD_PARAMS)
+
+    if isinstance(text, Mapping):
+        frequencies = {
+            word: count for word, count in text.items()
+            if not stopwords or word not in stopwords
+        }
+        wordcloud.generate_from_frequencies(frequencies)
+    else:
+        # Drop stop words in a single regex pass instead of a per-token set lookup
+        words = text.lower()
+        if stopwords:
+            words = _stop_words_pattern(frozenset(stopwords)).sub(" ", words)
+        wordcloud.generate(words)
 
     fig, ax = plt.subplots(figsize=(10, 5))
     ax.imshow(wordcloud, interpolation="bilinear")
@@ -110,7 +188,7 @@ def generate_wordcloud(text: str, stopwords: set = None) -> plt.Figure:
 
 
 def get_top_word_frequencies(
-    text: str, 
+    text: Union[str, Mapping[str, int]], 
     n: int = 20, 
     stop_words: set[str] = None
     ) -> Tuple[List[str], List[int]]:
@@ -121,7 +199,8 @@ def get_top_word_frequencies(
     corresponding frequencies.
 
     Args:
-        text: Preprocessed text string.
+        text: Preprocessed text string, or precomputed word counts such as the
+            output of ``count_words``.
         n: Number of top words to return.
         stop_words: Optional set of stop words to exclude.
 
@@ -135,25 +214,58 @@ def get_top_word_frequencies(
         >>> get_top_word_frequencies(text, n=2)
         (['anger', 'sadness'], [3, 2])
     """
-    cleaned = clean_text(text)
-    words = cleaned.split()
+    # Map each distinct word to an integer id and count the ids in C
+    if isinstance(text, Mapping):
+        vocab = np.array(list(text.keys()), dtype=object)
+        counts = np.fromiter(text.values(), dtype=np.int64, count=len(text))
+    else:
+        codes, vocab = pd.factorize(np.array(clean_text(text).split(), dtype=object))
+        counts = np.bincount(codes, minlength=len(vocab))
 
     if stop_words:
-        words = [word for word in words if word not in stop_words]
-
-    freq = Counter(words)
-    top_words = freq.most_common(n)
+        keep = ~pd.Index(vocab).isin(frozenset(stop_words))
+        vocab, counts = vocab[keep], counts[keep]
 
-    if not top_words:
+    if n <= 0 or len(vocab) == 0:
         return [], []
 
-    words, counts = zip(*top_words)
-    return list(words), list(counts)
+    # Select the top n in linear time, then order them by count; ties keep
+    # first-appearance order, as Counter.most_common does
+    k = min(n, len(counts))
+    top = np.argpartition(-counts, k - 1)[:k]
+    top = top[np.lexsort((top, -counts[top]))]
+    return vocab[top].tolist(), counts[top].tolist()
+
+
+def word_frequency_frame(words: List[str], counts: List[int]) -> pd.DataFrame:
+    """Put word frequencies into a small DataFrame for browser-side charts.
+
+    Streamlit can render this directly (e.g. with ``st.bar_chart`` or Altair),
+    which avoids building a matplotlib figure on the server.
+
+    Args:
+        words: List of words.
+        counts: Corresponding frequency counts.
+
+    Returns:
+        pd.DataFrame: A DataFrame with ``word`` and ``count`` columns, in the
+        given order.
+
+    Examples:
+        >>> word_frequency_frame(['museum', 'history'], [10, 8])
+              word  count
+        0   museum     10
+        1  history      8
+    """
+    return pd.DataFrame({"word": words, "count": counts})
 
 
 def plot_word_frequencies(words: List[str], counts: List[int]) -> plt.Figure:
     """Create a horizontal bar plot of word frequencies.
 
+    Prefer ``word_frequency_frame`` in the Streamlit app; this matplotlib
+    version is kept for scripts and notebooks.
+
     Args:
         words: List of words.
         counts: Corresponding frequency counts.
@@ -167,6 +279,9 @@ def plot_word_frequencies(words: List[str], counts: List[int]) -> plt.Figure:
         >>> fig = plot_word_frequencies(words, counts)
         >>> plt.show(fig)
     """
+    # seaborn is slow to import and only needed here
+    import seaborn as sns
+
     fig, ax = plt.subplots(figsize=(10, 6))
     sns.barplot(x=counts, y=words, palette="viridis", ax=ax)
     ax.set_title(f"Top {len(words)} Words in Combined Responses")